@@ -1,26 +1,44 @@
 """
 Claude Code Context Plugin
 
-A practical plugin that integrates directly with Claude Code for intelligent 
+A practical plugin that integrates directly with Claude Code for intelligent
 context management during AI development workflows.
 """
 
-from .core.plugin_manager import PluginManager
-from .core.monitor import ContextMonitor
-from .core.orchestrator import PluginOrchestrator
-from .cli.commands import main as cli_main
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Claude Context Management Team"
 
-# Plugin manager instance
-plugin_manager = PluginManager()
+# Exports are resolved on first access so that importing the package (e.g. to
+# run the CLI) doesn't load every core component up front.
+_LAZY_EXPORTS = {
+    'PluginManager': ('.core.plugin_manager', 'PluginManager'),
+    'ContextMonitor': ('.core.monitor', 'ContextMonitor'),
+    'PluginOrchestrator': ('.core.orchestrator', 'PluginOrchestrator'),
+    'cli_main': ('.cli.commands', 'main'),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    elif name == 'plugin_manager':
+        # Plugin manager instance
+        value = __getattr__('PluginManager')()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
 
 # Main exports
 __all__ = [
     'PluginManager',
-    'ContextMonitor', 
+    'ContextMonitor',
     'PluginOrchestrator',
     'cli_main',
     'plugin_manager'
-]
\ No newline at end of file
+]
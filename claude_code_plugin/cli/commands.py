@@ -4,272 +4,409 @@ Command-line interface for Claude Code Context Plugin
 
 import asyncio
 import argparse
+import functools
+import json
+import os
+import shutil
 import sys
+import tempfile
+import time
 from pathlib import Path
 from typing import Optional
 
-from ..core.monitor import ContextMonitor
-from ..core.orchestrator import PluginOrchestrator
-from ..core.plugin_manager import PluginManager
-from ..config import load_config
+# Core components and config are imported inside each command so that
+# `--help`, `init` and `config` don't pay for loading the core package.
 
 
+class LazyCtx:
+    """Per-invocation context whose attributes are loaded on first access"""
+
+    def __getattr__(self, name):
+        if name == 'config':
+            from ..config import load_config
+            self.config = load_config()
+            return self.config
+        raise AttributeError(name)
+
+
+PROG = 'claude-code-plugin'
+
+# Written by `init`
+_DEFAULT_CONFIG_BYTES = b'''# Claude Code Context Plugin Configuration
+
+PLUGIN_CONFIG = {
+    'token_limit': 200000,
+    'burn_rate_threshold': 150,
+    'auto_compact_threshold': 0.85,
+    'checkpoint_interval': 15,  # minutes
+    'monitoring_enabled': True,
+    'smart_suggestions': True
+}
+
+WORKFLOW_CONFIG = {
+    'coding_session_detection': True,
+    'debugging_mode_optimization': True,
+    'architecture_session_persistence': True,
+    'learning_from_patterns': True,
+    'proactive_recommendations': True
+}
+'''
+
+_STATUS_TMPL = (
+    "📊 Claude Code Context Status\n"
+    + "=" * 40 + "\n"
+    "🔋 Token Usage: {token_usage}\n"
+    "📈 Burn Rate: {burn_rate}\n"
+    "⏰ Time to Limit: {time_to_limit}\n"
+    "🎯 Session Type: {session_type}\n"
+    "📂 Context Files: {context_files}\n"
+)
+
+_STATUS_VERBOSE_TMPL = (
+    "\n🔍 Detailed Information:\n"
+    "📅 Session Start: {session_start}\n"
+    "🔄 Last Update: {last_update}\n"
+    "💾 Sessions Saved: {sessions_saved}\n"
+    "🎯 Confidence: {confidence}\n"
+)
+
+
+class _DefaultDict(dict):
+    """Mapping for str.format_map that renders missing keys as 'Unknown'"""
+
+    def __missing__(self, key):
+        return 'Unknown'
+
+
+def _build_monitor(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=monitor_command)
+    parser.add_argument('--daemon', action='store_true', help='Run as daemon')
+    parser.add_argument('--interval', type=int, default=30, help='Monitoring interval (seconds)')
+
+
+def _build_orchestrate(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=orchestrate_command)
+    parser.add_argument('--intent', required=True, help='Session intent description')
+    parser.add_argument('--dry-run', action='store_true', help='Show recommendation without executing')
+
+
+def _build_status(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=status_command)
+    parser.add_argument('--verbose', action='store_true', help='Show detailed information')
+
+
+def _build_history(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=history_command)
+    parser.add_argument('--limit', type=int, default=10, help='Number of sessions to show')
+
+
+def _build_init(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=init_command)
+    parser.add_argument('--force', action='store_true', help='Overwrite existing configuration')
+
+
+def _build_config(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=config_command)
+    parser.add_argument('--show', action='store_true', help='Show current configuration')
+    parser.add_argument('--edit', action='store_true', help='Edit configuration file')
+
+
+# Subcommand name -> (help text, builder adding its arguments)
+SUBCMD_BUILDERS = {
+    'monitor': ('Start context monitoring', _build_monitor),
+    'orchestrate': ('Manual orchestration', _build_orchestrate),
+    'status': ('Show current context status', _build_status),
+    'history': ('Show session history', _build_history),
+    'init': ('Initialize plugin configuration', _build_init),
+    'config': ('Manage plugin configuration', _build_config),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser"""
+    """Create the main argument parser
+    
+    Subcommands are registered as argument-less stubs so this phase only
+    resolves which command was requested; its own arguments are left
+    unparsed for create_subcommand_parser().
+    
+    Parsers are built once per process and reused by later main() calls;
+    call cache_clear() on this and create_subcommand_parser() after
+    changing SUBCMD_BUILDERS.
+    """
     parser = argparse.ArgumentParser(
-        prog='claude-code-plugin',
+        prog=PROG,
         description='Claude Code Context Plugin - Smart context management for AI development'
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Monitor command
-    monitor_parser = subparsers.add_parser('monitor', help='Start context monitoring')
-    monitor_parser.add_argument('--daemon', action='store_true', help='Run as daemon')
-    monitor_parser.add_argument('--interval', type=int, default=30, help='Monitoring interval (seconds)')
-    
-    # Orchestrate command
-    orchestrate_parser = subparsers.add_parser('orchestrate', help='Manual orchestration')
-    orchestrate_parser.add_argument('--intent', required=True, help='Session intent description')
-    orchestrate_parser.add_argument('--dry-run', action='store_true', help='Show recommendation without executing')
-    
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Show current context status')
-    status_parser.add_argument('--verbose', action='store_true', help='Show detailed information')
-    
-    # History command
-    history_parser = subparsers.add_parser('history', help='Show session history')
-    history_parser.add_argument('--limit', type=int, default=10, help='Number of sessions to show')
-    
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize plugin configuration')
-    init_parser.add_argument('--force', action='store_true', help='Overwrite existing configuration')
-    
-    # Config command
-    config_parser = subparsers.add_parser('config', help='Manage plugin configuration')
-    config_parser.add_argument('--show', action='store_true', help='Show current configuration')
-    config_parser.add_argument('--edit', action='store_true', help='Edit configuration file')
+    for name, (help_text, _) in SUBCMD_BUILDERS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
     
     return parser
 
 
-async def monitor_command(args):
-    """Start context monitoring"""
+@functools.lru_cache(maxsize=None)
+def create_subcommand_parser(command: str) -> argparse.ArgumentParser:
+    """Create the argument parser for a single subcommand"""
+    help_text, build = SUBCMD_BUILDERS[command]
+    parser = argparse.ArgumentParser(prog=f'{PROG} {command}', description=help_text)
+    build(parser)
+    return parser
+
+
+# A snapshot older than this many monitoring intervals is considered stale
+_STATE_MAX_AGE_TICKS = 2
+
+
+def _write_state_snapshot(sample: dict, interval: int):
+    """Atomically replace the status snapshot read by `status`"""
+    from ..config import STATE_PATH
+
+    snapshot = dict(sample, snapshot_time=time.time(), interval=interval,
+                    last_update=time.strftime("%H:%M:%S"))
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temp file per write so concurrent monitors can't clobber each other
+    fd, tmp_path = tempfile.mkstemp(dir=STATE_PATH.parent, prefix='state.', suffix='.tmp')
     try:
-        config = load_config()
-        monitor = ContextMonitor(config)
-        
-        print("🔄 Starting Claude Code Context Monitor...")
-        print(f"📊 Monitoring interval: {args.interval} seconds")
-        print(f"🎯 Token limit: {config.get('token_limit', 200000)}")
-        print("Press Ctrl+C to stop monitoring")
-        
-        if args.daemon:
-            print("🔧 Running as daemon...")
-            # In a real implementation, this would fork to background
-            
-        await monitor.start_monitoring(interval=args.interval)
-        
-    except KeyboardInterrupt:
-        print("\n⏹️  Monitoring stopped by user")
-    except Exception as e:
-        print(f"❌ Error during monitoring: {e}")
-        return 1
+        with os.fdopen(fd, 'w') as f:
+            f.write(json.dumps(snapshot))
+        os.replace(tmp_path, STATE_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
-async def orchestrate_command(args):
-    """Handle manual orchestration"""
+def _remove_state_snapshot():
+    """Delete the status snapshot once monitoring stops"""
+    from ..config import STATE_PATH
+
     try:
-        config = load_config()
-        orchestrator = PluginOrchestrator(config)
-        
-        print(f"🎯 Analyzing session intent: {args.intent}")
-        
-        # Get session data (in real implementation, this would collect from Claude Code)
-        session_data = {
-            'intent': args.intent,
-            'timestamp': 'now',
-            'context_size': 'estimated'
-        }
-        
-        decision = await orchestrator.make_decision(session_data)
-        
-        print(f"🤖 Decision: {decision.get('action', 'No action needed')}")
-        print(f"💡 Reasoning: {decision.get('reasoning', 'Standard analysis')}")
-        print(f"⏱️  Estimated time: {decision.get('estimated_time', 'Unknown')}")
-        
-        if args.dry_run:
-            print("🧪 Dry run mode - no commands executed")
-        else:
-            print("✅ Recommendation ready for execution")
-            
-    except Exception as e:
-        print(f"❌ Error during orchestration: {e}")
-        return 1
+        STATE_PATH.unlink()
+    except OSError:
+        pass
 
 
-async def status_command(args):
-    """Show current context status"""
+def _read_state_snapshot() -> Optional[dict]:
+    """Return the running monitor's status snapshot, or None if missing or stale"""
+    from ..config import STATE_PATH
+
     try:
-        config = load_config()
-        monitor = ContextMonitor(config)
+        snapshot = json.loads(STATE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    
+    max_age = _STATE_MAX_AGE_TICKS * snapshot.get('interval', 0)
+    if time.time() - snapshot.get('snapshot_time', 0) > max_age:
+        return None
+    return snapshot
+
+
+async def monitor_command(args, ctx: LazyCtx):
+    """Start context monitoring"""
+    from ..core.monitor import ContextMonitor
+
+    monitor = ContextMonitor(ctx.config)
+    
+    print("🔄 Starting Claude Code Context Monitor...")
+    print(f"📊 Monitoring interval: {args.interval} seconds")
+    print(f"🎯 Token limit: {ctx.config.get('token_limit', 200000)}")
+    print("Press Ctrl+C to stop monitoring")
+    
+    if args.daemon:
+        print("🔧 Running as daemon...")
+        # In a real implementation, this would fork to background
         
+    async def publish(sample):
+        # Make each handled sample available to `status`. The write is tiny and
+        # done inline, so none can still be in flight when the snapshot is
+        # removed on exit
+        _write_state_snapshot(sample, args.interval)
+    
+    await monitor.start_monitoring(args.interval, on_sample=publish)
+    try:
+        await monitor.monitoring_task
+    finally:
+        await monitor.stop_monitoring()
+        _remove_state_snapshot()
+
+
+async def orchestrate_command(args, ctx: LazyCtx):
+    """Handle manual orchestration"""
+    from ..core.orchestrator import PluginOrchestrator
+
+    orchestrator = PluginOrchestrator(ctx.config)
+    
+    print(f"🎯 Analyzing session intent: {args.intent}")
+    
+    # Get session data (in real implementation, this would collect from Claude Code)
+    session_data = {
+        'intent': args.intent,
+        'timestamp': 'now',
+        'context_size': 'estimated'
+    }
+    
+    decision = await orchestrator.make_decision(session_data)
+    
+    print(f"🤖 Decision: {decision.get('action', 'No action needed')}")
+    print(f"💡 Reasoning: {decision.get('reasoning', 'Standard analysis')}")
+    print(f"⏱️  Estimated time: {decision.get('estimated_time', 'Unknown')}")
+    
+    if args.dry_run:
+        print("🧪 Dry run mode - no commands executed")
+    else:
+        print("✅ Recommendation ready for execution")
+
+
+async def status_command(args, ctx: LazyCtx):
+    """Show current context status"""
+    # Prefer the snapshot published by a running `monitor`; only build a
+    # monitor (and load config) when there is no fresh one
+    status = _read_state_snapshot()
+    if status is None:
+        from ..core.monitor import ContextMonitor
+        monitor = ContextMonitor(ctx.config)
         status = await monitor.get_status()
-        
-        print("📊 Claude Code Context Status")
-        print("=" * 40)
-        print(f"🔋 Token Usage: {status.get('token_usage', 'Unknown')}")
-        print(f"📈 Burn Rate: {status.get('burn_rate', 'Unknown')}")
-        print(f"⏰ Time to Limit: {status.get('time_to_limit', 'Unknown')}")
-        print(f"🎯 Session Type: {status.get('session_type', 'Unknown')}")
-        print(f"📂 Context Files: {status.get('context_files', 'Unknown')}")
-        
-        if args.verbose:
-            print("\n🔍 Detailed Information:")
-            print(f"📅 Session Start: {status.get('session_start', 'Unknown')}")
-            print(f"🔄 Last Update: {status.get('last_update', 'Unknown')}")
-            print(f"💾 Sessions Saved: {status.get('sessions_saved', 'Unknown')}")
-            print(f"🎯 Confidence: {status.get('confidence', 'Unknown')}")
-            
-    except Exception as e:
-        print(f"❌ Error getting status: {e}")
-        return 1
+    
+    # Render the whole report and emit it with a single write
+    report = _STATUS_TMPL
+    if args.verbose:
+        report += _STATUS_VERBOSE_TMPL
+    sys.stdout.write(report.format_map(_DefaultDict(status)))
 
 
-async def history_command(args):
+async def history_command(args, ctx: LazyCtx):
     """Show session history"""
-    try:
-        config = load_config()
-        manager = PluginManager(config)
-        
-        sessions = await manager.get_session_history(limit=args.limit)
-        
-        print(f"📅 Recent Sessions (last {args.limit}):")
-        print("=" * 50)
+    from ..core.plugin_manager import PluginManager
+
+    manager = PluginManager(ctx.config)
+    
+    sessions = await manager.get_session_history(limit=args.limit)
+    
+    buf = [
+        f"📅 Recent Sessions (last {args.limit}):",
+        "=" * 50,
+    ]
+    
+    for i, session in enumerate(sessions, 1):
+        buf.append(f"{i}. {session.get('name', 'Unknown')} "
+                   f"({session.get('duration', 'Unknown')} - "
+                   f"{session.get('date', 'Unknown')})")
         
-        for i, session in enumerate(sessions, 1):
-            print(f"{i}. {session.get('name', 'Unknown')} "
-                  f"({session.get('duration', 'Unknown')} - "
-                  f"{session.get('date', 'Unknown')})")
-            
-        if not sessions:
-            print("No sessions found")
-            
-    except Exception as e:
-        print(f"❌ Error getting history: {e}")
-        return 1
+    if not sessions:
+        buf.append("No sessions found")
+    
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
-def init_command(args):
+async def init_command(args, ctx: LazyCtx):
     """Initialize plugin configuration"""
-    try:
-        config_path = Path.home() / '.claude' / 'claude-code-plugin' / 'config.py'
+    from ..config import CONFIG_PATH as config_path
+
+    if config_path.exists() and not args.force:
+        print(f"❌ Configuration already exists at {config_path}")
+        print("Use --force to overwrite")
+        return 1
         
-        if config_path.exists() and not args.force:
-            print(f"❌ Configuration already exists at {config_path}")
-            print("Use --force to overwrite")
-            return 1
-            
-        # Create config directory
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+    # Create config directory
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Create default configuration
+    config_path.write_bytes(_DEFAULT_CONFIG_BYTES)
         
-        # Create default configuration
-        default_config = '''# Claude Code Context Plugin Configuration
+    print(f"✅ Configuration initialized at {config_path}")
+    print("🔧 Edit the configuration file to customize settings")
 
-PLUGIN_CONFIG = {
-    'token_limit': 200000,
-    'burn_rate_threshold': 150,
-    'auto_compact_threshold': 0.85,
-    'checkpoint_interval': 15,  # minutes
-    'monitoring_enabled': True,
-    'smart_suggestions': True
-}
 
-WORKFLOW_CONFIG = {
-    'coding_session_detection': True,
-    'debugging_mode_optimization': True,
-    'architecture_session_persistence': True,
-    'learning_from_patterns': True,
-    'proactive_recommendations': True
-}
-'''
-        
-        with open(config_path, 'w') as f:
-            f.write(default_config)
-            
-        print(f"✅ Configuration initialized at {config_path}")
-        print("🔧 Edit the configuration file to customize settings")
-        
-    except Exception as e:
-        print(f"❌ Error initializing configuration: {e}")
-        return 1
+def _copy_config_to_stdout(config_path: Path):
+    """Stream the config file to stdout without decoding it"""
+    sys.stdout.flush()
+    with open(config_path, 'rb') as f:
+        offset = 0
+        try:
+            # Kernel-side copy where the platform and stdout allow it
+            out_fd = sys.stdout.fileno()
+            size = os.fstat(f.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # Resume after whatever sendfile already wrote
+            f.seek(offset)
+            shutil.copyfileobj(f, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
 
 
-def config_command(args):
+async def config_command(args, ctx: LazyCtx):
     """Manage plugin configuration"""
-    try:
-        config_path = Path.home() / '.claude' / 'claude-code-plugin' / 'config.py'
-        
-        if args.show:
-            if config_path.exists():
-                print(f"📄 Configuration file: {config_path}")
-                print("=" * 50)
-                with open(config_path, 'r') as f:
-                    print(f.read())
-            else:
-                print("❌ Configuration file not found")
-                print("Run 'claude-code-plugin init' to create one")
-                return 1
-                
-        elif args.edit:
-            if config_path.exists():
-                import os
-                editor = os.environ.get('EDITOR', 'nano')
-                os.system(f"{editor} {config_path}")
-            else:
-                print("❌ Configuration file not found")
-                print("Run 'claude-code-plugin init' to create one")
-                return 1
+    from ..config import CONFIG_PATH as config_path
+
+    if args.show:
+        if config_path.exists():
+            print(f"📄 Configuration file: {config_path}")
+            print("=" * 50)
+            loop = asyncio.get_running_loop()
+            await asyncio.wait_for(
+                loop.run_in_executor(None, _copy_config_to_stdout, config_path), timeout=10
+            )
+            print()
         else:
-            print("❌ Use --show or --edit with config command")
+            print("❌ Configuration file not found")
+            print("Run 'claude-code-plugin init' to create one")
             return 1
             
-    except Exception as e:
-        print(f"❌ Error managing configuration: {e}")
+    elif args.edit:
+        if config_path.exists():
+            import shlex
+            editor = shlex.split(os.environ.get('EDITOR', 'nano'))
+            # Exec the editor directly; no shell, so paths with spaces are safe
+            proc = await asyncio.create_subprocess_exec(*editor, str(config_path))
+            await proc.wait()
+        else:
+            print("❌ Configuration file not found")
+            print("Run 'claude-code-plugin init' to create one")
+            return 1
+    else:
+        print("❌ Use --show or --edit with config command")
         return 1
 
 
+def _run(coro):
+    """Run a command coroutine, on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if hasattr(uvloop, 'run'):
+        return uvloop.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 def main():
     """Main CLI entry point"""
     parser = create_parser()
-    args = parser.parse_args()
+    args, rest = parser.parse_known_args()
     
     if not args.command:
         parser.print_help()
         return 1
     
+    args = create_subcommand_parser(args.command).parse_args(rest, namespace=args)
+    
+    ctx = LazyCtx()
+    
     try:
-        if args.command == 'monitor':
-            return asyncio.run(monitor_command(args))
-        elif args.command == 'orchestrate':
-            return asyncio.run(orchestrate_command(args))
-        elif args.command == 'status':
-            return asyncio.run(status_command(args))
-        elif args.command == 'history':
-            return asyncio.run(history_command(args))
-        elif args.command == 'init':
-            return init_command(args)
-        elif args.command == 'config':
-            return config_command(args)
-        else:
-            print(f"❌ Unknown command: {args.command}")
-            return 1
-            
+        rc = _run(args.func(args, ctx))
+        return rc or 0
     except KeyboardInterrupt:
         print("\n⏹️  Operation cancelled by user")
-        return 1
+        return 130
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        print(f"❌ Error in {args.command}: {e}", file=sys.stderr)
         return 1
 
 
@@ -30,20 +30,57 @@ WORKFLOW_CONFIG = {
     'proactive_recommendations': True
 }
 
+# Parsed configurations keyed by (path, mtime_ns, size)
+_CFG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+# Resolved once at import; call _refresh_config_path() if HOME changes
+CONFIG_PATH: Path = Path.home() / '.claude' / 'claude-code-plugin' / 'config.py'
+
+# Latest status snapshot written by a running monitor
+STATE_PATH: Path = CONFIG_PATH.parent / 'state.json'
+
+
+def _refresh_config_path() -> Path:
+    """Recompute CONFIG_PATH and STATE_PATH from the current home directory"""
+    global CONFIG_PATH, STATE_PATH
+    CONFIG_PATH = Path.home() / '.claude' / 'claude-code-plugin' / 'config.py'
+    STATE_PATH = CONFIG_PATH.parent / 'state.json'
+    return CONFIG_PATH
+
 
 def get_config_path() -> Path:
     """Get the configuration file path"""
-    return Path.home() / '.claude' / 'claude-code-plugin' / 'config.py'
+    return CONFIG_PATH
+
+
+def clear_config_cache():
+    """Drop all cached configurations"""
+    _CFG_CACHE.clear()
 
 
 def load_config() -> Dict[str, Any]:
     """Load configuration from file or use defaults"""
     config_path = get_config_path()
     
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         # Return default configuration
         return {**DEFAULT_CONFIG, **WORKFLOW_CONFIG}
     
+    # Re-parse only when the file changed since it was last loaded
+    key = (str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+    if key not in _CFG_CACHE:
+        for stale in [k for k in _CFG_CACHE if k[0] == key[0]]:
+            del _CFG_CACHE[stale]
+        _CFG_CACHE[key] = _parse_config(config_path)
+    
+    return dict(_CFG_CACHE[key])
+
+
+def _parse_config(config_path: Path) -> Dict[str, Any]:
+    """Execute a configuration file and merge it over the defaults"""
     try:
         # Load configuration from Python file
         spec = importlib.util.spec_from_file_location("config", config_path)
@@ -97,6 +134,7 @@ WORKFLOW_CONFIG = {workflow_config!r}
         with open(config_path, 'w') as f:
             f.write(config_content)
         
+        clear_config_cache()
         return True
         
     except Exception as e:
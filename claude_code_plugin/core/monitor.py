@@ -8,7 +8,7 @@ and session patterns.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Callable, Awaitable
 from collections import deque
 
 logger = logging.getLogger(__name__)
@@ -45,15 +45,19 @@ class ContextMonitor:
         
         logger.info("Context Monitor initialized")
     
-    async def start_monitoring(self, interval: int = 30):
-        """Start monitoring context usage"""
+    async def start_monitoring(self, interval: int = 30,
+                               on_sample: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None):
+        """Start monitoring context usage
+        
+        on_sample, if given, is awaited with each sample after it was handled.
+        """
         if self.is_monitoring:
             logger.warning("Monitoring already active")
             return
         
         self.is_monitoring = True
         self.monitoring_task = asyncio.create_task(
-            self._monitoring_loop(interval)
+            self._monitoring_loop(interval, on_sample)
         )
         
         logger.info(f"Context monitoring started (interval: {interval}s)")
@@ -216,24 +220,58 @@ class ContextMonitor:
         
         return sum(factors) / len(factors) if factors else 0.5
     
-    async def _monitoring_loop(self, interval: int):
+    async def sample(self) -> Dict[str, Any]:
+        """Collect one monitoring sample"""
+        await self._update_session_metrics()
+        sample = await self.get_status()
+        # Unformatted values as of this sample, for handle()
+        sample['raw'] = {
+            'tokens': self.current_tokens,
+            'token_limit': self.token_limit,
+            'burn_rate': self.burn_rate,
+            'session_minutes': (datetime.now() - self.session_start).total_seconds() / 60
+        }
+        return sample
+    
+    async def handle(self, sample: Dict[str, Any]):
+        """Act on a monitoring sample"""
+        raw = sample['raw']
+        logger.debug(f"Handling sample: {sample.get('token_usage')}")
+        await self._check_optimization_opportunities(
+            raw['tokens'], raw['token_limit'], raw['burn_rate'], raw['session_minutes']
+        )
+    
+    async def _monitoring_loop(self, interval: int, on_sample=None):
         """Main monitoring loop"""
+        # Sampling and handling run concurrently so a slow consumer doesn't
+        # delay the next tick; the bounded queue applies backpressure
+        queue = asyncio.Queue(maxsize=64)
+        await asyncio.gather(
+            self._produce(queue, interval),
+            self._consume(queue, on_sample),
+        )
+    
+    async def _produce(self, queue: asyncio.Queue, interval: int):
+        """Sample every interval and queue the results"""
         while self.is_monitoring:
             try:
-                # Update session metrics
-                await self._update_session_metrics()
-                
-                # Check for optimization opportunities
-                await self._check_optimization_opportunities()
-                
-                # Sleep for interval
-                await asyncio.sleep(interval)
-                
-            except asyncio.CancelledError:
-                break
+                await queue.put(await self.sample())
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(interval)
+            await asyncio.sleep(interval)
+    
+    async def _consume(self, queue: asyncio.Queue, on_sample=None):
+        """Handle queued samples in order"""
+        while True:
+            sample = await queue.get()
+            try:
+                await self.handle(sample)
+                if on_sample is not None:
+                    await on_sample(sample)
+            except Exception as e:
+                logger.error(f"Error in monitoring loop: {e}")
+            finally:
+                queue.task_done()
     
     async def _update_session_metrics(self):
         """Update session metrics"""
@@ -255,9 +293,10 @@ class ContextMonitor:
         
         logger.debug(f"Session metrics updated - Tokens: {self.current_tokens}, Burn rate: {self.burn_rate:.1f}")
     
-    async def _check_optimization_opportunities(self):
+    async def _check_optimization_opportunities(self, tokens: float, token_limit: int,
+                                                burn_rate: float, session_duration: float):
         """Check for optimization opportunities"""
-        usage_percentage = (self.current_tokens / self.token_limit) * 100
+        usage_percentage = (tokens / token_limit) * 100
         
         # Check critical thresholds
         if usage_percentage > 95:
@@ -266,11 +305,10 @@ class ContextMonitor:
             logger.info("⚠️ High token usage - consider optimization")
         
         # Check burn rate
-        if self.burn_rate > self.config.get('burn_rate_threshold', 150):
+        if burn_rate > self.config.get('burn_rate_threshold', 150):
             logger.info("📈 High burn rate detected")
         
         # Check session duration
-        session_duration = (datetime.now() - self.session_start).total_seconds() / 60
         if session_duration > 180:  # 3 hours
             logger.info("⏰ Very long session - consider break or digest")
     
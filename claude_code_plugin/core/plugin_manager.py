@@ -89,8 +89,9 @@ class PluginManager:
             if not history_file.exists():
                 return []
             
-            with open(history_file, 'r') as f:
-                all_sessions = json.load(f)
+            # All sessions live in one file; read it without blocking the loop
+            loop = asyncio.get_running_loop()
+            all_sessions = await loop.run_in_executor(None, self._read_history, history_file)
             
             # Return most recent sessions
             return all_sessions[-limit:] if all_sessions else []
@@ -99,6 +100,12 @@ class PluginManager:
             logger.error(f"Error getting session history: {e}")
             return []
     
+    @staticmethod
+    def _read_history(history_file: Path) -> List[Dict]:
+        """Read the session history file"""
+        with open(history_file, 'r') as f:
+            return json.load(f)
+    
     async def handle_claude_code_event(self, event_type: str, event_data: Dict):
         """Handle events from Claude Code"""
         try:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the plugin command-line interface
+"""
+
+import asyncio
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from argparse import Namespace
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_code_plugin import config
+from claude_code_plugin.cli import commands
+
+
+class TestTwoPhaseParser(unittest.TestCase):
+    """Test suite for command-then-arguments parsing"""
+    
+    def _parse(self, argv):
+        args, rest = commands.create_parser().parse_known_args(argv)
+        return commands.create_subcommand_parser(args.command).parse_args(rest, namespace=args)
+    
+    def test_root_parser_defers_subcommand_arguments(self):
+        """Test that the first phase only resolves the command"""
+        args, rest = commands.create_parser().parse_known_args(['monitor', '--interval', '5'])
+        
+        self.assertEqual(args.command, 'monitor')
+        self.assertEqual(rest, ['--interval', '5'])
+    
+    def test_subcommand_arguments_and_handler(self):
+        """Test that the second phase parses the command's own arguments"""
+        args = self._parse(['monitor', '--interval', '5', '--daemon'])
+        
+        self.assertEqual(args.interval, 5)
+        self.assertTrue(args.daemon)
+        self.assertIs(args.func, commands.monitor_command)
+    
+    def test_subcommand_defaults(self):
+        """Test that every subcommand resolves to its handler with defaults"""
+        self.assertEqual(self._parse(['history']).limit, 10)
+        self.assertFalse(self._parse(['status']).verbose)
+        self.assertIs(self._parse(['config']).func, commands.config_command)
+    
+    def test_unknown_subcommand_argument_is_rejected(self):
+        """Test that arguments of another subcommand are errors"""
+        with redirect_stdout(io.StringIO()), patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(SystemExit):
+                self._parse(['status', '--interval', '5'])
+    
+    def test_main_without_command_prints_help(self):
+        """Test that main() without a command shows usage and fails"""
+        out = io.StringIO()
+        with patch.object(sys, 'argv', ['claude-code-plugin']), redirect_stdout(out):
+            self.assertEqual(commands.main(), 1)
+        
+        self.assertIn('Available commands', out.getvalue())
+
+
+class TestStateSnapshot(unittest.TestCase):
+    """Test suite for the status snapshot shared by `monitor` and `status`"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.home_patch = patch.dict(os.environ, {'HOME': self.temp_dir})
+        self.home_patch.start()
+        config._refresh_config_path()
+    
+    def tearDown(self):
+        self.home_patch.stop()
+        config._refresh_config_path()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_missing_snapshot(self):
+        """Test that no snapshot reads as None"""
+        self.assertIsNone(commands._read_state_snapshot())
+    
+    def test_fresh_snapshot_round_trip(self):
+        """Test that a just-written snapshot is returned"""
+        commands._write_state_snapshot({'token_usage': '100/200,000 (0.1%)'}, 30)
+        
+        snapshot = commands._read_state_snapshot()
+        
+        self.assertEqual(snapshot['token_usage'], '100/200,000 (0.1%)')
+        self.assertEqual(snapshot['interval'], 30)
+        self.assertEqual(os.listdir(config.STATE_PATH.parent), ['state.json'])
+    
+    def test_stale_snapshot(self):
+        """Test that a snapshot older than two intervals is ignored"""
+        config.STATE_PATH.parent.mkdir(parents=True)
+        config.STATE_PATH.write_text(json.dumps({
+            'token_usage': 'old', 'interval': 30, 'snapshot_time': time.time() - 61
+        }))
+        
+        self.assertIsNone(commands._read_state_snapshot())
+    
+    def test_corrupt_snapshot(self):
+        """Test that an unreadable snapshot reads as None"""
+        config.STATE_PATH.parent.mkdir(parents=True)
+        config.STATE_PATH.write_text('{not json')
+        
+        self.assertIsNone(commands._read_state_snapshot())
+    
+    def test_remove_snapshot(self):
+        """Test that removing the snapshot works whether or not it exists"""
+        commands._write_state_snapshot({}, 30)
+        
+        commands._remove_state_snapshot()
+        commands._remove_state_snapshot()
+        
+        self.assertFalse(config.STATE_PATH.exists())
+    
+    def test_status_prefers_fresh_snapshot(self):
+        """Test that `status` renders the running monitor's snapshot"""
+        commands._write_state_snapshot({'token_usage': '4,242/200,000 (2.1%)'}, 30)
+        out = io.StringIO()
+        
+        with redirect_stdout(out):
+            asyncio.run(commands.status_command(Namespace(verbose=False), commands.LazyCtx()))
+        
+        self.assertIn('4,242/200,000', out.getvalue())
+        self.assertIn('Burn Rate: Unknown', out.getvalue())
+    
+    def test_status_falls_back_to_live_monitor(self):
+        """Test that `status` without a fresh snapshot builds its own reading"""
+        out = io.StringIO()
+        
+        with redirect_stdout(out):
+            asyncio.run(commands.status_command(Namespace(verbose=False), commands.LazyCtx()))
+        
+        self.assertIn('0/200,000 (0.0%)', out.getvalue())
+
+
+def run_tests():
+    """Run all tests"""
+    unittest.main(verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test Suite for plugin configuration loading
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_code_plugin import config
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """Test suite for the stat-keyed load_config cache"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.home_patch = patch.dict(os.environ, {'HOME': self.temp_dir})
+        self.home_patch.start()
+        self.config_path = config._refresh_config_path()
+        self.config_path.parent.mkdir(parents=True)
+        config.clear_config_cache()
+    
+    def tearDown(self):
+        self.home_patch.stop()
+        config._refresh_config_path()
+        config.clear_config_cache()
+        shutil.rmtree(self.temp_dir)
+    
+    def _write_config(self, token_limit, mtime_ns=None):
+        with open(self.config_path, 'w') as f:
+            f.write(f"PLUGIN_CONFIG = {{'token_limit': {token_limit}}}\n")
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+    
+    def test_defaults_without_config_file(self):
+        """Test that a missing file yields the defaults"""
+        loaded = config.load_config()
+        
+        self.assertEqual(loaded['token_limit'], config.DEFAULT_CONFIG['token_limit'])
+        self.assertIn('coding_session_detection', loaded)
+    
+    def test_unchanged_file_is_parsed_once(self):
+        """Test that repeated loads reuse the parsed file"""
+        self._write_config(1000)
+        
+        with patch.object(config, '_parse_config', wraps=config._parse_config) as parse:
+            first = config.load_config()
+            second = config.load_config()
+        
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(first['token_limit'], 1000)
+        self.assertEqual(second, first)
+    
+    def test_mtime_change_invalidates(self):
+        """Test that a same-size edit with a new mtime is re-parsed"""
+        self._write_config(1000, mtime_ns=1_000_000_000_000_000_000)
+        self.assertEqual(config.load_config()['token_limit'], 1000)
+        
+        self._write_config(2000, mtime_ns=1_000_000_001_000_000_000)
+        
+        self.assertEqual(config.load_config()['token_limit'], 2000)
+    
+    def test_size_change_invalidates(self):
+        """Test that an edit keeping the old mtime is re-parsed when the size differs"""
+        mtime_ns = 1_000_000_000_000_000_000
+        self._write_config(1000, mtime_ns=mtime_ns)
+        self.assertEqual(config.load_config()['token_limit'], 1000)
+        
+        self._write_config(30000, mtime_ns=mtime_ns)
+        
+        self.assertEqual(config.load_config()['token_limit'], 30000)
+    
+    def test_stale_entries_are_evicted(self):
+        """Test that only the latest version of a file stays cached"""
+        self._write_config(1000, mtime_ns=1_000_000_000_000_000_000)
+        config.load_config()
+        self._write_config(2000, mtime_ns=1_000_000_001_000_000_000)
+        config.load_config()
+        
+        self.assertEqual(len(config._CFG_CACHE), 1)
+    
+    def test_returned_config_is_a_copy(self):
+        """Test that mutating a loaded config doesn't affect the cache"""
+        self._write_config(1000)
+        
+        config.load_config()['token_limit'] = 5
+        
+        self.assertEqual(config.load_config()['token_limit'], 1000)
+    
+    def test_save_config_clears_cache(self):
+        """Test that saving drops cached configurations"""
+        self._write_config(1000)
+        config.load_config()
+        
+        self.assertTrue(config.save_config({'token_limit': 4000}))
+        
+        self.assertEqual(config._CFG_CACHE, {})
+        self.assertEqual(config.load_config()['token_limit'], 4000)
+
+
+def run_tests():
+    """Run all tests"""
+    unittest.main(verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Enhanced EAEPT Workflow Engine
+"""
+
+import asyncio
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'workflow'))
+
+import eaept_engine
+from eaept_engine import EAEPTWorkflowEngine, _load_yaml_cached
+
+
+class TestYamlCache(unittest.TestCase):
+    """Test suite for the parsed-YAML cache"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.yaml_path = Path(self.temp_dir) / 'eaept-config.yaml'
+        eaept_engine._YAML_CACHE.clear()
+    
+    def tearDown(self):
+        eaept_engine._YAML_CACHE.clear()
+        shutil.rmtree(self.temp_dir)
+    
+    def _write_yaml(self, threshold, mtime_ns=None):
+        self.yaml_path.write_text(f"phases:\n  express:\n    token_threshold: {threshold}\n")
+        if mtime_ns is not None:
+            os.utime(self.yaml_path, ns=(mtime_ns, mtime_ns))
+    
+    def test_unchanged_file_is_parsed_once(self):
+        """Test that repeated loads reuse the parsed file"""
+        self._write_yaml(0.5)
+        
+        with patch.object(eaept_engine, '_load_yaml_via_sidecar',
+                          wraps=eaept_engine._load_yaml_via_sidecar) as load:
+            first = _load_yaml_cached(self.yaml_path)
+            second = _load_yaml_cached(self.yaml_path)
+        
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first, {'phases': {'express': {'token_threshold': 0.5}}})
+        self.assertEqual(second, first)
+    
+    def test_mutations_do_not_leak_into_cache(self):
+        """Test that callers get a deep copy of the cached data"""
+        self._write_yaml(0.5)
+        
+        data = _load_yaml_cached(self.yaml_path)
+        data['phases']['express']['token_threshold'] = 0.99
+        data['phases']['ask'] = {}
+        
+        self.assertEqual(_load_yaml_cached(self.yaml_path),
+                         {'phases': {'express': {'token_threshold': 0.5}}})
+    
+    def test_changed_file_is_reparsed(self):
+        """Test that a new mtime invalidates the cached data"""
+        self._write_yaml(0.5, mtime_ns=1_000_000_000_000_000_000)
+        _load_yaml_cached(self.yaml_path)
+        
+        self._write_yaml(0.6, mtime_ns=1_000_000_001_000_000_000)
+        
+        self.assertEqual(_load_yaml_cached(self.yaml_path)['phases']['express']['token_threshold'], 0.6)
+    
+    def test_stale_sidecar_is_ignored(self):
+        """Test that a sidecar newer than the YAML but made from another version isn't used"""
+        self._write_yaml(0.5)
+        _load_yaml_cached(self.yaml_path)
+        eaept_engine._YAML_CACHE.clear()
+        
+        # e.g. `cp -p` restoring an older file under the sidecar
+        self._write_yaml(0.6, mtime_ns=1_000_000_000_000_000_000)
+        
+        self.assertEqual(_load_yaml_cached(self.yaml_path)['phases']['express']['token_threshold'], 0.6)
+    
+    def test_matching_sidecar_is_used(self):
+        """Test that an unchanged YAML is read back from its sidecar"""
+        self._write_yaml(0.5)
+        _load_yaml_cached(self.yaml_path)
+        eaept_engine._YAML_CACHE.clear()
+        
+        with patch.object(eaept_engine.yaml, 'load') as yaml_load:
+            data = _load_yaml_cached(self.yaml_path)
+        
+        yaml_load.assert_not_called()
+        self.assertEqual(data, {'phases': {'express': {'token_threshold': 0.5}}})
+
+
+class TestPhaseMetrics(unittest.TestCase):
+    """Test suite for PhaseMetrics"""
+    
+    def test_serialized_form_is_a_snapshot(self):
+        """Test that later notes don't change an already serialized dict"""
+        metrics = eaept_engine.PhaseMetrics(eaept_engine.EAEPTPhase.CODE)
+        metrics.notes.append('first')
+        
+        data = metrics.to_serializable()
+        metrics.notes.append('second')
+        
+        self.assertEqual(data['notes'], ['first'])
+
+
+class FakeOrchestrator:
+    """Orchestration engine stand-in whose session grows as phases run"""
+    
+    def __init__(self):
+        self.token_count = 1000
+        self.analyze_calls = 0
+        self.analyzer = self
+    
+    async def analyze_session(self):
+        self.analyze_calls += 1
+        await asyncio.sleep(0)  # like the real analyzer, yield before sampling
+        return Mock(token_count=self.token_count)
+    
+    async def orchestrate(self, intent):
+        return {'command_executed': 'none'}
+
+
+class FakeOrchestratorTestCase(unittest.TestCase):
+    """Base for tests running the engine against FakeOrchestrator"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.fake = FakeOrchestrator()
+        self.engine_patch = patch.object(eaept_engine, 'OrchestrationEngine', lambda: self.fake)
+        self.engine_patch.start()
+    
+    def tearDown(self):
+        self.engine_patch.stop()
+        shutil.rmtree(self.temp_dir)
+    
+    def _make_engine(self, tokens=100, confidence=None):
+        """Engine whose phase bodies each use `tokens`
+        
+        confidence is a one-item list so a test can change it between runs.
+        """
+        confidence = confidence or [0.95]
+        engine = EAEPTWorkflowEngine(self.temp_dir)
+        
+        async def body():
+            self.fake.token_count += tokens
+            return {'confidence': confidence[0], 'quality': 0.9}
+        
+        for handler_name in engine._PHASE_HANDLERS.values():
+            setattr(engine, handler_name, body)
+        return engine
+
+
+class TestPhaseTokenReadings(FakeOrchestratorTestCase):
+    """Test suite for per-phase token accounting"""
+    
+    def test_phase_usage_excludes_neighbouring_phases(self):
+        """Test that each phase is charged only for the tokens it used"""
+        engine = self._make_engine()
+        
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(engine.start_workflow('count tokens'))
+        
+        self.assertEqual([m.token_usage for m in engine.phase_metrics.values()], [100] * 6)
+        # One reading per phase boundary: six phases share seven readings
+        self.assertEqual(self.fake.analyze_calls, 7)
+    
+    def test_resumed_workflow_takes_fresh_start_reading(self):
+        """Test that a paused workflow doesn't reuse its last reading when resumed"""
+        confidence = [0.5]  # below EXPRESS's auto-transition threshold
+        engine = self._make_engine(confidence=confidence)
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(engine.start_workflow('pause me'))
+        self.assertEqual(engine.current_phase, eaept_engine.EAEPTPhase.EXPRESS)
+        
+        # Tokens used between runs belong to no phase
+        self.fake.token_count += 5000
+        confidence[0] = 0.95
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(engine.execute_full_workflow())
+        
+        self.assertEqual(engine.phase_metrics[eaept_engine.EAEPTPhase.EXPRESS].token_usage, 100)
+        self.assertEqual(engine.current_phase, eaept_engine.EAEPTPhase.COMPLETE)
+    
+    def test_reading_is_only_carried_to_the_next_phase(self):
+        """Test that a phase run out of order takes its own start reading"""
+        engine = self._make_engine()
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(engine.execute_current_phase())
+            self.fake.token_count += 5000
+            engine.current_phase = eaept_engine.EAEPTPhase.PLAN
+            asyncio.run(engine.execute_current_phase())
+        
+        self.assertEqual(engine.phase_metrics[eaept_engine.EAEPTPhase.PLAN].token_usage, 100)
+    
+    def test_disabled_orchestration_skips_orchestrator(self):
+        """Test that auto_orchestration_enabled=False never touches the orchestrator"""
+        state_dir = Path(self.temp_dir) / 'config'
+        state_dir.mkdir()
+        (state_dir / '.eaept-state.json').write_text(json.dumps({'auto_orchestration_enabled': False}))
+        engine = EAEPTWorkflowEngine(self.temp_dir)
+        
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(engine.start_workflow('no orchestration'))
+        
+        self.assertEqual(engine.current_phase, eaept_engine.EAEPTPhase.COMPLETE)
+        self.assertEqual(self.fake.analyze_calls, 0)
+        self.assertIsNone(engine._orchestrator)
+
+
+class TestStateRestore(FakeOrchestratorTestCase):
+    """Test suite for resuming a workflow from its saved state"""
+    
+    def _run_workflow(self):
+        engine = self._make_engine(tokens=250)
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(engine.start_workflow('resume me'))
+        return engine
+    
+    def test_saved_metrics_are_restored(self):
+        """Test that a new engine picks up the saved phase metrics"""
+        saved = self._run_workflow()
+        
+        restored = EAEPTWorkflowEngine(self.temp_dir)
+        
+        self.assertEqual(restored.current_phase, eaept_engine.EAEPTPhase.COMPLETE)
+        self.assertEqual(restored.current_task, 'resume me')
+        self.assertEqual(list(restored.phase_metrics), list(saved.phase_metrics))
+        for phase, original in saved.phase_metrics.items():
+            metrics = restored.phase_metrics[phase]
+            self.assertEqual(metrics.start_time, original.start_time)
+            self.assertEqual(metrics.end_time, original.end_time)
+            self.assertEqual(metrics.token_usage, 250)
+            self.assertEqual(metrics.completion_confidence, 0.95)
+            self.assertEqual(metrics.quality_score, 0.9)
+            self.assertAlmostEqual(metrics.duration_minutes, original.duration_minutes, places=4)
+    
+    def test_rerun_of_restored_phase_is_not_completed(self):
+        """Test that restarting a restored phase clears its saved end time"""
+        self._run_workflow()
+        restored = EAEPTWorkflowEngine(self.temp_dir)
+        metrics = restored.phase_metrics[eaept_engine.EAEPTPhase.EXPLORE]
+        
+        self.assertEqual(metrics.token_usage, 250)
+        
+        metrics.mark_start()
+        
+        self.assertIsNone(metrics.end_time)
+        self.assertEqual(metrics.token_usage, 0)
+        status = restored.get_workflow_status()
+        self.assertFalse(status['phase_metrics']['explore']['completed'])
+        self.assertIsNone(restored._build_state_dict()['phase_metrics']['explore']['end_time'])
+    
+    def test_unreadable_metrics_are_skipped(self):
+        """Test that a corrupt phase entry doesn't prevent loading the rest"""
+        self._run_workflow()
+        state_path = Path(self.temp_dir) / 'config' / '.eaept-state.json'
+        state = json.loads(state_path.read_text())
+        state['phase_metrics']['plan'] = {'start_time': 'not a date'}
+        state_path.write_text(json.dumps(state))
+        
+        with redirect_stdout(io.StringIO()):
+            restored = EAEPTWorkflowEngine(self.temp_dir)
+        
+        self.assertNotIn(eaept_engine.EAEPTPhase.PLAN, restored.phase_metrics)
+        self.assertEqual(len(restored.phase_metrics), 5)
+
+
+def run_tests():
+    """Run all tests"""
+    unittest.main(verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
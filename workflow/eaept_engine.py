@@ -4,6 +4,7 @@ Enhanced EAEPT Workflow Engine - Core Implementation
 Systematic Express-Ask-Explore-Plan-Code-Test methodology with auto-orchestration
 """
 
+import copy
 import json
 import os
 import sys
@@ -11,6 +12,8 @@ import time
 import asyncio
 import argparse
 import subprocess
+import tempfile
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -28,6 +31,79 @@ except (ImportError, SyntaxError) as e:
     ContextMetrics = None
     CommandType = None
 
+# orjson is optional; fall back to the stdlib encoder
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+# Use libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed YAML files: path -> (st_mtime_ns, st_size, data), least recently used first
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+def _atomic_write(path: Path, data: bytes):
+    """Replace path with data via a unique temp file in the same directory"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _load_yaml_via_sidecar(path: Path, st: os.stat_result) -> Any:
+    """Parse a YAML file, preferring a `<name>.yaml.json` sidecar made from this exact version"""
+    json_path = path.with_suffix(path.suffix + '.json')
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(json_path, 'r') as f:
+            sidecar = json.load(f)
+        if isinstance(sidecar, dict) and sidecar.get('source') == source:
+            return sidecar['data']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    
+    # Only emit the sidecar when JSON can represent the data exactly
+    try:
+        encoded = json.dumps({'source': source, 'data': data})
+        if json.loads(encoded)['data'] == data:
+            _atomic_write(json_path, encoded.encode())
+    except (OSError, TypeError, ValueError):
+        pass  # e.g. read-only config directory
+    
+    return data
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged"""
+    st = os.stat(path)
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+    
+    data = _load_yaml_via_sidecar(path, st)
+    
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
 class EAEPTPhase(Enum):
     """Enhanced EAEPT workflow phases"""
     EXPRESS = "express"
@@ -62,10 +138,19 @@ class PhaseConfig:
     
 class PhaseMetrics:
     """Metrics for tracking phase execution"""
+    __slots__ = ('phase', 'start_time', 'end_time', 'token_usage_start', 'token_usage_end',
+                 'context_optimizations', 'rag_queries', 'user_interactions',
+                 'completion_confidence', 'quality_score', 'notes', '_start_ns', '_end_ns',
+                 '_start_iso')
+    
     def __init__(self, phase: EAEPTPhase):
         self.phase = phase
+        # Wall-clock times are kept for display and persistence; durations
+        # are measured with the monotonic clock
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
+        self._start_ns: Optional[int] = time.monotonic_ns()
+        self._end_ns: Optional[int] = None
         self.token_usage_start = 0
         self.token_usage_end = 0
         self.context_optimizations = 0
@@ -74,37 +159,156 @@ class PhaseMetrics:
         self.completion_confidence = 0.0
         self.quality_score = 0.0
         self.notes: List[str] = []
+        self._start_iso: Optional[str] = None
+
+    def mark_start(self):
+        """Record the start of phase execution"""
+        self.start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
+        self._start_iso = None
+        # A re-run phase (e.g. one restored from disk) starts from scratch
+        self.end_time = None
+        self._end_ns = None
+        self.token_usage_start = 0
+        self.token_usage_end = 0
+    
+    def mark_end(self):
+        """Record the end of phase execution"""
+        self.end_time = datetime.now()
+        self._end_ns = time.monotonic_ns()
 
     @property
     def duration_minutes(self) -> float:
-        end = self.end_time or datetime.now()
-        return (end - self.start_time).total_seconds() / 60
+        if self._start_ns is None:
+            # No monotonic reading (e.g. times restored from disk)
+            end = self.end_time or datetime.now()
+            return (end - self.start_time).total_seconds() / 60
+        end_ns = self._end_ns if self._end_ns is not None else time.monotonic_ns()
+        return (end_ns - self._start_ns) / 6e10
+    
+    @property
+    def start_iso(self) -> str:
+        """start_time in ISO format, formatted once per start"""
+        if self._start_iso is None:
+            self._start_iso = self.start_time.isoformat()
+        return self._start_iso
     
     @property
     def token_usage(self) -> int:
         return max(0, self.token_usage_end - self.token_usage_start)
+    
+    @classmethod
+    def from_dict(cls, phase: EAEPTPhase, data: Dict[str, Any]) -> 'PhaseMetrics':
+        """Rebuild metrics saved by to_serializable"""
+        metrics = cls(phase)
+        metrics.start_time = datetime.fromisoformat(data['start_time'])
+        end = data.get('end_time')
+        metrics.end_time = datetime.fromisoformat(end) if end else None
+        # No monotonic readings survive a restart; durations fall back to wall-clock times
+        metrics._start_ns = None
+        metrics.token_usage_end = data.get('token_usage', 0)
+        metrics.completion_confidence = data.get('completion_confidence', 0.0)
+        metrics.quality_score = data.get('quality_score', 0.0)
+        metrics.notes = list(data.get('notes', []))
+        return metrics
+    
+    def to_serializable(self) -> Dict[str, Any]:
+        """Plain-dict form for the state file"""
+        end = self.end_time
+        return {
+            'start_time': self.start_iso,
+            'end_time': end.isoformat() if end else None,
+            'duration_minutes': self.duration_minutes,
+            'token_usage': self.token_usage,
+            'completion_confidence': self.completion_confidence,
+            'quality_score': self.quality_score,
+            'notes': list(self.notes)
+        }
 
 class EAEPTWorkflowEngine:
     """Main enhanced EAEPT workflow engine with auto-orchestration"""
     
+    # Claude's context window, in tokens
+    _TOKEN_LIMIT = 200_000
+    _INV_TOKEN_LIMIT = 1.0 / _TOKEN_LIMIT
+    
+    # Phase -> name of the method executing it
+    _PHASE_HANDLERS = {
+        EAEPTPhase.EXPRESS: '_execute_express_phase',
+        EAEPTPhase.ASK: '_execute_ask_phase',
+        EAEPTPhase.EXPLORE: '_execute_explore_phase',
+        EAEPTPhase.PLAN: '_execute_plan_phase',
+        EAEPTPhase.CODE: '_execute_code_phase',
+        EAEPTPhase.TEST: '_execute_test_phase',
+    }
+    
+    # Phase -> phase that follows it
+    _NEXT_PHASE = {
+        EAEPTPhase.EXPRESS: EAEPTPhase.ASK,
+        EAEPTPhase.ASK: EAEPTPhase.EXPLORE,
+        EAEPTPhase.EXPLORE: EAEPTPhase.PLAN,
+        EAEPTPhase.PLAN: EAEPTPhase.CODE,
+        EAEPTPhase.CODE: EAEPTPhase.TEST,
+        EAEPTPhase.TEST: EAEPTPhase.COMPLETE,
+    }
+    
     def __init__(self, project_root: Optional[str] = None):
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.config_path = self.project_root / "config" / "eaept-config.yaml"
         self.state_path = self.project_root / "config" / ".eaept-state.json"
         self.rag_url = "http://localhost:8000"
         
-        # Initialize components
-        self.orchestrator = OrchestrationEngine() if OrchestrationEngine else None
+        # Initialize components (the orchestrator is built on first use)
+        self._orchestrator = None
+        # (next phase, token count) from the end of the previous phase, reused
+        # as that phase's starting reading when it runs directly afterwards in
+        # the same execute_full_workflow loop
+        self._carried_start: Optional[Tuple[EAEPTPhase, int]] = None
         self.phase_configs = self._load_phase_configs()
         self.workflow_state = self._load_workflow_state()
         self.current_phase = EAEPTPhase(self.workflow_state.get('current_phase', 'express'))
         self.current_task = self.workflow_state.get('current_task', '')
+        
+        # Decide once whether orchestration runs at all; every orchestrator
+        # call site checks this flag
+        self._orchestration_active = (
+            OrchestrationEngine is not None
+            and bool(self.workflow_state.get('auto_orchestration_enabled', True))
+        )
+        
+        # Phase metrics are restored from the saved state or created on first
+        # use; COMPLETE never gets any
         self.phase_metrics: Dict[EAEPTPhase, PhaseMetrics] = {}
+        for value, data in self.workflow_state.get('phase_metrics', {}).items():
+            try:
+                phase = EAEPTPhase(value)
+                if phase != EAEPTPhase.COMPLETE:
+                    self.phase_metrics[phase] = PhaseMetrics.from_dict(phase, data)
+            except (KeyError, TypeError, ValueError):
+                print(f"Warning: Ignoring unreadable metrics for phase {value!r}")
         
-        # Initialize phase metrics
-        for phase in EAEPTPhase:
-            if phase.value not in self.workflow_state.get('phase_metrics', {}):
-                self.phase_metrics[phase] = PhaseMetrics(phase)
+        # State persistence: only write when something changed, at most once
+        # per _min_save_interval unless forced
+        self._state_dirty = False
+        self._last_save_ts = 0.0
+        self._min_save_interval = 1.0
+        self._state_parent_ensured = False
+        self._serialized_cache: Dict[EAEPTPhase, Tuple[tuple, Dict[str, Any]]] = {}
+
+    
+    @property
+    def orchestrator(self):
+        """Orchestration engine, or None in fallback mode"""
+        if self._orchestrator is None and OrchestrationEngine:
+            self._orchestrator = OrchestrationEngine()
+        return self._orchestrator
+    
+    def _get_or_create_metrics(self, phase: EAEPTPhase) -> PhaseMetrics:
+        """Metrics for a phase, created on first access"""
+        m = self.phase_metrics.get(phase)
+        if m is None:
+            m = self.phase_metrics[phase] = PhaseMetrics(phase)
+        return m
     
     def _load_phase_configs(self) -> Dict[EAEPTPhase, PhaseConfig]:
         """Load phase configurations"""
@@ -166,15 +370,14 @@ class EAEPTWorkflowEngine:
         # Load custom configs if available
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    custom_config = yaml.safe_load(f)
-                    for phase_name, config_data in custom_config.get('phases', {}).items():
-                        phase = EAEPTPhase(phase_name)
-                        if phase in default_configs:
-                            # Update default config with custom values
-                            for key, value in config_data.items():
-                                if hasattr(default_configs[phase], key):
-                                    setattr(default_configs[phase], key, value)
+                custom_config = _load_yaml_cached(self.config_path)
+                for phase_name, config_data in custom_config.get('phases', {}).items():
+                    phase = EAEPTPhase(phase_name)
+                    if phase in default_configs:
+                        # Update default config with custom values
+                        for key, value in config_data.items():
+                            if hasattr(default_configs[phase], key):
+                                setattr(default_configs[phase], key, value)
             except Exception as e:
                 print(f"Warning: Could not load custom config: {e}")
         
@@ -198,35 +401,69 @@ class EAEPTWorkflowEngine:
             'auto_orchestration_enabled': True
         }
     
-    def _save_workflow_state(self):
-        """Save current workflow state"""
-        state_data = {
+    def _serialize_phase_metrics(self, phase: EAEPTPhase, metrics: PhaseMetrics) -> Dict[str, Any]:
+        """Serialize one phase's metrics, reusing the result for finished phases"""
+        key = (id(metrics), metrics.end_time, metrics.token_usage, metrics.completion_confidence,
+               metrics.quality_score, len(metrics.notes))
+        cached = self._serialized_cache.get(phase)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        data = metrics.to_serializable()
+        # A running phase's duration changes on every call, so only cache finished ones
+        if metrics.end_time is not None:
+            self._serialized_cache[phase] = (key, data)
+        return data
+    
+    def _build_state_dict(self) -> Dict[str, Any]:
+        """Snapshot the current workflow state as a JSON-ready dict"""
+        phase_metrics = {}
+        for phase, metrics in self.phase_metrics.items():
+            phase_metrics[phase.value] = self._serialize_phase_metrics(phase, metrics)
+        
+        now_iso = datetime.now().isoformat()
+        return {
             'current_phase': self.current_phase.value,
             'current_task': self.current_task,
             'workflow_state': self.workflow_state.get('workflow_state', 'in_progress'),
-            'phase_metrics': {
-                phase.value: {
-                    'start_time': metrics.start_time.isoformat(),
-                    'end_time': metrics.end_time.isoformat() if metrics.end_time else None,
-                    'duration_minutes': metrics.duration_minutes,
-                    'token_usage': metrics.token_usage,
-                    'completion_confidence': metrics.completion_confidence,
-                    'quality_score': metrics.quality_score,
-                    'notes': metrics.notes
-                }
-                for phase, metrics in self.phase_metrics.items()
-            },
-            'session_start': self.workflow_state.get('session_start', datetime.now().isoformat()),
-            'last_update': datetime.now().isoformat(),
+            'phase_metrics': phase_metrics,
+            'session_start': self.workflow_state.get('session_start', now_iso),
+            'last_update': now_iso,
             'auto_orchestration_enabled': self.workflow_state.get('auto_orchestration_enabled', True)
         }
-        
+    
+    def _write_state_dict(self, state_data: Dict[str, Any]) -> bool:
+        """Write a state snapshot to disk (blocking)"""
         try:
-            os.makedirs(self.state_path.parent, exist_ok=True)
-            with open(self.state_path, 'w') as f:
-                json.dump(state_data, f, indent=2)
+            if not self._state_parent_ensured:
+                os.makedirs(self.state_path.parent, exist_ok=True)
+                self._state_parent_ensured = True
+            # Machine-read file: compact encoding, no indentation. Replaced
+            # atomically so a crash never leaves a torn checkpoint
+            _atomic_write(self.state_path, _dumps(state_data))
+            return True
         except Exception as e:
             print(f"Warning: Could not save workflow state: {e}")
+            # The directory may have been removed; check again next time
+            self._state_parent_ensured = False
+            return False
+    
+    async def _save_workflow_state(self, force: bool = False):
+        """Save current workflow state
+        
+        Skipped unless the state is dirty and the last save is at least
+        _min_save_interval seconds old; force=True always writes. The
+        snapshot is taken on the event loop and written from a worker thread.
+        """
+        if not force and not (self._state_dirty and
+                              time.monotonic() - self._last_save_ts >= self._min_save_interval):
+            return
+        
+        state_data = self._build_state_dict()
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self._write_state_dict, state_data):
+            self._state_dirty = False
+            self._last_save_ts = time.monotonic()
     
     async def start_workflow(self, task_description: str, auto_execute: bool = True) -> Dict[str, Any]:
         """Start new EAEPT workflow"""
@@ -238,12 +475,15 @@ class EAEPTWorkflowEngine:
         self.current_phase = EAEPTPhase.EXPRESS
         self.workflow_state['workflow_state'] = 'in_progress'
         self.workflow_state['current_task'] = task_description
+        self._state_dirty = True
         
         # Start orchestration monitoring
-        if self.orchestrator:
+        if self._orchestration_active:
             await self.orchestrator.orchestrate(f"Starting EAEPT workflow: {task_description}")
         
-        # Initialize phase metrics
+        # Initialize phase metrics, dropping any restored from a previous workflow
+        self.phase_metrics.clear()
+        self._carried_start = None
         self.phase_metrics[self.current_phase] = PhaseMetrics(self.current_phase)
         
         if auto_execute:
@@ -269,6 +509,7 @@ class EAEPTWorkflowEngine:
                 else:
                     print(f"⏸️  Workflow paused at {self.current_phase.value} phase")
                     self.workflow_state['workflow_state'] = 'paused'
+                    self._state_dirty = True
                     break
             
             if self.current_phase == EAEPTPhase.COMPLETE:
@@ -278,55 +519,64 @@ class EAEPTWorkflowEngine:
         except Exception as e:
             print(f"❌ Workflow error: {e}")
             self.workflow_state['workflow_state'] = 'error'
+            self._state_dirty = True
             workflow_results['error'] = str(e)
         
         finally:
-            self._save_workflow_state()
+            # A later run may start after the session changed; never reuse
+            # this loop's last reading
+            self._carried_start = None
+            await self._save_workflow_state(force=True)
         
         return workflow_results
     
     async def execute_current_phase(self) -> Dict[str, Any]:
         """Execute the current EAEPT phase"""
         config = self.phase_configs[self.current_phase]
-        metrics = self.phase_metrics[self.current_phase]
+        metrics = self._get_or_create_metrics(self.current_phase)
         
         print(f"📋 {config.name}: {config.description}")
         
-        # Start phase execution
-        metrics.start_time = datetime.now()
-        if self.orchestrator:
-            context = await self.orchestrator.analyzer.analyze_session()
-            metrics.token_usage_start = context.token_count
+        # Start phase execution; back-to-back phases share one reading at
+        # the boundary instead of analyzing the session twice
+        metrics.mark_start()
+        carried, self._carried_start = self._carried_start, None
+        if self._orchestration_active:
+            if carried is not None and carried[0] == self.current_phase:
+                metrics.token_usage_start = carried[1]
+            else:
+                context = await self.orchestrator.analyzer.analyze_session()
+                metrics.token_usage_start = context.token_count
         
         try:
             # Execute phase-specific logic
-            if self.current_phase == EAEPTPhase.EXPRESS:
-                result = await self._execute_express_phase()
-            elif self.current_phase == EAEPTPhase.ASK:
-                result = await self._execute_ask_phase()
-            elif self.current_phase == EAEPTPhase.EXPLORE:
-                result = await self._execute_explore_phase()
-            elif self.current_phase == EAEPTPhase.PLAN:
-                result = await self._execute_plan_phase()
-            elif self.current_phase == EAEPTPhase.CODE:
-                result = await self._execute_code_phase()
-            elif self.current_phase == EAEPTPhase.TEST:
-                result = await self._execute_test_phase()
-            else:
+            handler_name = self._PHASE_HANDLERS.get(self.current_phase)
+            if handler_name is None:
                 result = {"status": "unknown_phase"}
+            else:
+                result = await getattr(self, handler_name)()
             
             # End phase execution
-            metrics.end_time = datetime.now()
-            if self.orchestrator:
-                context = await self.orchestrator.analyzer.analyze_session()
-                metrics.token_usage_end = context.token_count
+            metrics.mark_end()
+            end_context = None
+            if self._orchestration_active:
+                end_context = await self.orchestrator.analyzer.analyze_session()
+                metrics.token_usage_end = end_context.token_count
             
             # Auto-orchestration after phase
-            if config.token_threshold and self.orchestrator:
-                await self._handle_context_optimization(config)
+            optimized = False
+            if config.token_threshold and self._orchestration_active:
+                optimized = await self._handle_context_optimization(config, context=end_context)
+            
+            # An optimization changes the context, so the next phase then
+            # needs a fresh starting reading
+            next_phase = self._NEXT_PHASE.get(self.current_phase)
+            if end_context is not None and not optimized and next_phase is not None:
+                self._carried_start = (next_phase, end_context.token_count)
             
             metrics.completion_confidence = result.get('confidence', 0.8)
             metrics.quality_score = result.get('quality', 0.8)
+            self._state_dirty = True
             
             print(f"✅ {config.name} phase completed")
             print(f"   Duration: {metrics.duration_minutes:.1f} minutes")
@@ -336,8 +586,9 @@ class EAEPTWorkflowEngine:
             return result
             
         except Exception as e:
-            metrics.end_time = datetime.now()
+            metrics.mark_end()
             metrics.notes.append(f"Error: {str(e)}")
+            self._state_dirty = True
             print(f"❌ {config.name} phase failed: {e}")
             raise
     
@@ -405,7 +656,7 @@ class EAEPTWorkflowEngine:
     async def _should_auto_transition(self) -> bool:
         """Determine if workflow should auto-transition to next phase"""
         config = self.phase_configs[self.current_phase]
-        metrics = self.phase_metrics[self.current_phase]
+        metrics = self._get_or_create_metrics(self.current_phase)
         
         # Check completion confidence
         if metrics.completion_confidence < config.auto_transition_threshold:
@@ -415,34 +666,23 @@ class EAEPTWorkflowEngine:
     
     async def _transition_to_next_phase(self):
         """Transition to the next EAEPT phase"""
-        phase_order = [
-            EAEPTPhase.EXPRESS,
-            EAEPTPhase.ASK,
-            EAEPTPhase.EXPLORE,
-            EAEPTPhase.PLAN,
-            EAEPTPhase.CODE,
-            EAEPTPhase.TEST,
-            EAEPTPhase.COMPLETE
-        ]
-        
-        current_index = phase_order.index(self.current_phase)
-        if current_index < len(phase_order) - 1:
-            self.current_phase = phase_order[current_index + 1]
-            self.phase_metrics[self.current_phase] = PhaseMetrics(self.current_phase)
+        if self.current_phase != EAEPTPhase.COMPLETE:
+            self.current_phase = self._NEXT_PHASE[self.current_phase]
+            if self.current_phase != EAEPTPhase.COMPLETE:
+                self.phase_metrics[self.current_phase] = PhaseMetrics(self.current_phase)
             print(f"🔄 Auto-transitioning to {self.current_phase.value.upper()} phase")
         else:
             self.current_phase = EAEPTPhase.COMPLETE
             print("🎯 Workflow completed!")
         
-        self._save_workflow_state()
+        self._state_dirty = True
+        await self._save_workflow_state()
     
-    async def _handle_context_optimization(self, config: PhaseConfig):
-        """Handle context optimization for phase"""
-        if not self.orchestrator:
-            return
-        
-        context = await self.orchestrator.analyzer.analyze_session()
-        token_ratio = context.token_count / 200000  # Claude's limit
+    async def _handle_context_optimization(self, config: PhaseConfig, context=None) -> bool:
+        """Handle context optimization for phase; returns whether a command ran"""
+        if context is None:
+            context = await self.orchestrator.analyzer.analyze_session()
+        token_ratio = context.token_count * self._INV_TOKEN_LIMIT
         
         if token_ratio > config.token_threshold:
             strategy = config.context_optimization_strategy
@@ -453,41 +693,63 @@ class EAEPTWorkflowEngine:
             )
             
             if result.get('command_executed') != 'none':
-                self.phase_metrics[self.current_phase].context_optimizations += 1
+                self._get_or_create_metrics(self.current_phase).context_optimizations += 1
                 print(f"✅ Context optimized: {result.get('command_executed')}")
+                return True
+        
+        return False
     
     async def _generate_workflow_summary(self) -> Dict[str, Any]:
         """Generate comprehensive workflow summary"""
-        total_duration = sum(metrics.duration_minutes for metrics in self.phase_metrics.values())
-        total_tokens = sum(metrics.token_usage for metrics in self.phase_metrics.values())
+        # Aggregate everything in a single pass over the phases
+        total_duration = 0.0
+        total_tokens = 0
+        confidence_sum = 0.0
+        quality_sum = 0.0
+        phases_completed = 0
+        optimizations = 0
+        for m in self.phase_metrics.values():
+            total_duration += m.duration_minutes
+            total_tokens += m.token_usage
+            confidence_sum += m.completion_confidence
+            quality_sum += m.quality_score
+            optimizations += m.context_optimizations
+            if m.end_time:
+                phases_completed += 1
+        phase_count = len(self.phase_metrics) or 1
         
         return {
             "task": self.current_task,
             "total_duration_minutes": round(total_duration, 1),
             "total_token_usage": total_tokens,
-            "phases_completed": len([m for m in self.phase_metrics.values() if m.end_time]),
-            "average_confidence": round(sum(m.completion_confidence for m in self.phase_metrics.values()) / len(self.phase_metrics), 2),
-            "average_quality": round(sum(m.quality_score for m in self.phase_metrics.values()) / len(self.phase_metrics), 2),
-            "context_optimizations": sum(m.context_optimizations for m in self.phase_metrics.values()),
+            "phases_completed": phases_completed,
+            "average_confidence": round(confidence_sum / phase_count, 2),
+            "average_quality": round(quality_sum / phase_count, 2),
+            "context_optimizations": optimizations,
             "workflow_efficiency": "High - Enhanced EAEPT with auto-orchestration"
         }
     
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status"""
+        # Each phase's duration is computed once and reused for the total
+        phase_metrics = {}
+        total_duration = 0.0
+        for phase, metrics in self.phase_metrics.items():
+            duration = metrics.duration_minutes
+            total_duration += duration
+            phase_metrics[phase.value] = {
+                "duration": duration,
+                "completed": metrics.end_time is not None,
+                "confidence": metrics.completion_confidence,
+                "quality": metrics.quality_score
+            }
+        
         return {
             "current_phase": self.current_phase.value,
             "current_task": self.current_task,
             "workflow_state": self.workflow_state.get('workflow_state', 'unknown'),
-            "phase_metrics": {
-                phase.value: {
-                    "duration": metrics.duration_minutes,
-                    "completed": metrics.end_time is not None,
-                    "confidence": metrics.completion_confidence,
-                    "quality": metrics.quality_score
-                }
-                for phase, metrics in self.phase_metrics.items()
-            },
-            "total_duration": sum(m.duration_minutes for m in self.phase_metrics.values()),
+            "phase_metrics": phase_metrics,
+            "total_duration": total_duration,
             "session_start": self.workflow_state.get('session_start')
         }
 